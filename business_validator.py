@@ -4,49 +4,127 @@ Business Validator AI Agent
 A multi-agent system that validates business ideas using pyautogen.
 """
 
+import asyncio
+import copy
+import functools
+import hashlib
 import os
 import json
+import random
+import re
+import threading
+import time
+import weakref
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Awaitable, Callable, Dict, List, Any, Optional, Tuple
 from dotenv import load_dotenv
 import autogen
+import diskcache
 from duckduckgo_search import DDGS
+from duckduckgo_search.exceptions import RatelimitException
+import httpx
 import openai
 import logging
 
 # Load environment variables
 load_dotenv()
 
-# Configure logging - only show INFO and above, suppress autogen DEBUG logs
+# Configure logging - only show WARNING and above; BV_DEBUG enables DEBUG
+# logs for this module alone, not for the libraries it uses
 logging.basicConfig(
-    level=logging.INFO,
+    level=logging.WARNING,
     format="%(asctime)s - %(levelname)s - %(message)s",
     datefmt="%H:%M:%S",
 )
-logging.getLogger("autogen").setLevel(logging.WARNING)
-logging.getLogger("openai").setLevel(logging.WARNING)
-
-_real_create = openai.ChatCompletion.create
+logger = logging.getLogger(__name__)
+if os.getenv("BV_DEBUG"):
+    logger.setLevel(logging.DEBUG)
+
+
+def create_async_client(api_key: Optional[str] = None) -> openai.AsyncOpenAI:
+    """Create an AsyncOpenAI client backed by a pooled, keep-alive HTTP/2 connection."""
+    return openai.AsyncOpenAI(
+        api_key=api_key,
+        http_client=httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+            timeout=openai.DEFAULT_TIMEOUT,
+        ),
+    )
 
 
-def logging_create(*args, **kwargs):
-    model = kwargs.get("model", "unknown")
-    messages = kwargs.get("messages", [])
-    if messages:
-        first_msg = (
-            messages[0].get("content", "")
-            if isinstance(messages[0], dict)
-            else str(messages[0])
+async def logging_create(client: openai.AsyncOpenAI, **kwargs):
+    if logger.isEnabledFor(logging.DEBUG):
+        messages = kwargs.get("messages", [])
+        if messages:
+            first_msg = (
+                messages[0].get("content", "")
+                if isinstance(messages[0], dict)
+                else str(messages[0])
+            )
+        else:
+            first_msg = ""
+        logger.debug(
+            "API call model=%s first=%.100r", kwargs.get("model", "unknown"), first_msg
         )
-    else:
-        first_msg = ""
-    print(
-        f"🤖 API Call: {model} - {first_msg[:80]}{'...' if len(first_msg) > 80 else ''}"
-    )
-    return _real_create(*args, **kwargs)
+    return await client.chat.completions.create(**kwargs)
+
+
+# Web search results are cached on disk so re-validating the same idea does not
+# hit DuckDuckGo (and its rate limits) again within a day.
+SEARCH_CACHE_DIR = os.getenv("BV_SEARCH_CACHE_DIR", ".ddg_cache")
+SEARCH_CACHE_TTL = 24 * 60 * 60
+
+
+@functools.lru_cache(maxsize=None)
+def _get_search_cache() -> diskcache.Cache:
+    """Open the on-disk search cache on first use."""
+    return diskcache.Cache(SEARCH_CACHE_DIR)
+
+
+def _get_cached_search(query: str) -> Optional[List[str]]:
+    """Return cached search results for the query, or None on a cache miss."""
+    key = hashlib.sha1(query.encode("utf-8")).hexdigest()
+    return _get_search_cache().get(key)
 
 
-openai.ChatCompletion.create = logging_create
+def _cache_search(query: str, results: List[str]) -> None:
+    """Cache non-empty search results for SEARCH_CACHE_TTL seconds."""
+    if results:
+        key = hashlib.sha1(query.encode("utf-8")).hexdigest()
+        _get_search_cache().set(key, results, expire=SEARCH_CACHE_TTL)
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_patterns(patterns: Tuple[str, ...]) -> "re.Pattern[str]":
+    """Compile literal patterns into one regex that finds any of them in a single scan."""
+    return re.compile("|".join(re.escape(pattern) for pattern in patterns))
+
+
+# DuckDuckGo rate-limits bursts of queries, so cap the number of concurrent
+# searches and back off exponentially when it does.
+SEARCH_CONCURRENCY = 4
+SEARCH_MAX_ATTEMPTS = 3
+_search_slots = threading.BoundedSemaphore(SEARCH_CONCURRENCY)
+
+
+def _take_novel_snippets(results: List[str], seen: set, limit: int) -> List[str]:
+    """Return up to ``limit`` snippets not in ``seen``, recording only those."""
+    novel = []
+    for body in results:
+        if len(novel) == limit:
+            break
+        digest = hashlib.blake2b(body.encode("utf-8"), digest_size=8).digest()
+        if digest not in seen:
+            seen.add(digest)
+            novel.append(body)
+    return novel
+
+
+def _close_ddgs_clients(clients: List[DDGS]) -> None:
+    """Close the given DDGS clients."""
+    for ddgs in clients:
+        ddgs.__exit__(None, None, None)
 
 
 class WebSearchAgent(autogen.AssistantAgent):
@@ -68,99 +146,345 @@ class WebSearchAgent(autogen.AssistantAgent):
         )
         self.config_list = config_list
         self.business_idea = business_idea
+        # Idle DDGS clients, reused so searches keep their HTTP connections
+        self._idle_ddgs: List[DDGS] = []
+        self._ddgs_lock = threading.Lock()
+        weakref.finalize(self, _close_ddgs_clients, self._idle_ddgs)
+
+    def _acquire_ddgs(self) -> DDGS:
+        """Take an idle DDGS client, or create one if none is idle."""
+        with self._ddgs_lock:
+            if self._idle_ddgs:
+                return self._idle_ddgs.pop()
+        return DDGS()
+
+    def _release_ddgs(self, ddgs: DDGS) -> None:
+        """Return a DDGS client whose last search succeeded to the idle pool."""
+        with self._ddgs_lock:
+            self._idle_ddgs.append(ddgs)
+
+    def _ddg_text(self, query: str) -> List[Dict[str, str]]:
+        """Run a DuckDuckGo text search, retrying with backoff when rate limited.
+
+        Each attempt has a DDGS client to itself. A client refuses every call
+        after one of its requests fails, so a failed one is closed instead of
+        going back to the pool, and the retry runs on another client.
+        """
+        for attempt in range(SEARCH_MAX_ATTEMPTS):
+            ddgs = self._acquire_ddgs()
+            try:
+                with _search_slots:
+                    results = list(ddgs.text(query, max_results=5))
+            except RatelimitException:
+                ddgs.__exit__(None, None, None)
+                if attempt == SEARCH_MAX_ATTEMPTS - 1:
+                    raise
+            except Exception:
+                ddgs.__exit__(None, None, None)
+                raise
+            else:
+                self._release_ddgs(ddgs)
+                return results
+            delay = 2**attempt + random.random()
+            logger.warning("DuckDuckGo rate limit hit, retrying in %.1fs", delay)
+            time.sleep(delay)
 
     def web_search(self, query: str) -> List[str]:
         """Perform web search using DuckDuckGo."""
+        return self._fetch_search_results(query)
+
+    async def web_search_async(self, query: str) -> List[str]:
+        """(async) Perform web search without blocking the event loop."""
+        return await asyncio.to_thread(self._fetch_search_results, query)
+
+    def _fetch_search_results(self, query: str) -> List[str]:
+        """Fetch search result snippets from the cache or DuckDuckGo."""
+        cached = _get_cached_search(query)
+        if cached is not None:
+            print(f"♻️  Cached Web Search: {query}")
+            return cached
+
         try:
             print(f"🔍 Web Search: {query}")
-            with DDGS() as ddgs:
-                results = list(ddgs.text(query, max_results=5))
-                return [result["body"] for result in results]
+            results = self._ddg_text(query)
+            bodies = [result["body"] for result in results]
         except Exception as e:
             print(f"❌ Web search error: {e}")
             return []
 
+        _cache_search(query, bodies)
+        return bodies
+
+    def _search_query(self, subject: Optional[str] = None) -> str:
+        """Build the web search query for this agent, or "" if it does no research.
+
+        Searches for ``subject`` if given, otherwise for the agent's business_idea.
+        """
+        if subject is None:
+            subject = self.business_idea
+        if self.name == "MarketResearcher":
+            return f"market trends and analysis for {subject}"
+        elif self.name == "CompetitorScout":
+            return f"top competitors and alternatives for {subject}"
+        return ""
+
+    def _with_search_results(
+        self, messages: List[Dict], search_results: List[str]
+    ) -> List[Dict]:
+        """Append the search results to the last message, if any were found."""
+        if not search_results:
+            print(f"⚠️  No web search results found for {self.name}")
+            return messages
+
+        print(f"📊 Found {len(search_results)} search results")
+        search_context = "\n\nWEB SEARCH RESULTS:\n" + "\n".join(search_results)
+        last_message = dict(messages[-1])
+        last_message["content"] = last_message.get("content", "") + search_context
+        return messages[:-1] + [last_message]
+
     def generate_reply(self, messages=None, sender=None, config=None):
         """Override to include web search in responses."""
-        # Get the last message content
         if messages and len(messages) > 0:
-            last_message = messages[-1].get("content", "")
-
-            # Perform web search if the agent is supposed to do research
-            search_results = []
-            if self.name == "MarketResearcher":
-                query = f"market trends and analysis for {self.business_idea}"
-                search_results = self.web_search(query)
-            elif self.name == "CompetitorScout":
-                query = f"top competitors and alternatives for {self.business_idea}"
-                search_results = self.web_search(query)
-
-            # Add search results to the context if available
-            if search_results:
-                print(f"📊 Found {len(search_results)} search results")
-                search_context = "\n\nWEB SEARCH RESULTS:\n" + "\n".join(
-                    search_results[:3]
-                )
-                # Modify the last message to include search results
-                messages[-1]["content"] = last_message + search_context
-            else:
-                print(f"⚠️  No web search results found for {self.name}")
+            query = self._search_query()
+            if query:
+                search_results = _take_novel_snippets(self.web_search(query), set(), 3)
+                messages = self._with_search_results(messages, search_results)
 
         # Call the parent method to generate the reply
         return super().generate_reply(messages=messages, sender=sender, config=config)
 
+    async def a_generate_reply(self, messages=None, sender=None, **kwargs):
+        """(async) Override to include web search in responses."""
+        if messages and len(messages) > 0:
+            query = self._search_query()
+            if query:
+                search_results = _take_novel_snippets(
+                    await self.web_search_async(query), set(), 3
+                )
+                messages = self._with_search_results(messages, search_results)
+
+        return await super().a_generate_reply(
+            messages=messages, sender=sender, **kwargs
+        )
+
 
 class BusinessValidatorAgent:
+    AGENT_TASKS = {
+        "market_researcher": "Research market trends and opportunities for this business idea.",
+        "competitor_scout": "Identify and analyze the competitors for this business idea.",
+    }
+
+    # MarketResearcher and CompetitorScout are exposed to the model as tools so
+    # a single completion can request both searches in parallel.
+    RESEARCH_TOOLS = [
+        {
+            "type": "function",
+            "function": {
+                "name": "market_research",
+                "description": "Search the web for market size, growth, trends and regulation data.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "query": {
+                            "type": "string",
+                            "description": "Optional extra web search query; the standard search for the business idea is always included",
+                        }
+                    },
+                    "required": [],
+                },
+            },
+        },
+        {
+            "type": "function",
+            "function": {
+                "name": "competitor_scout",
+                "description": "Search the web for direct and indirect competitors and alternatives.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "query": {
+                            "type": "string",
+                            "description": "Optional extra web search query; the standard search for the business idea is always included",
+                        }
+                    },
+                    "required": [],
+                },
+            },
+        },
+    ]
+
+    RESEARCH_TOOL_AGENTS = {
+        "market_research": "market_researcher",
+        "competitor_scout": "competitor_scout",
+    }
+
+    # Headings that delimit the two sections of the combined research reply
+    MARKET_SECTION = "### MARKET RESEARCHER"
+    COMPETITOR_SECTION = "### COMPETITOR SCOUT"
+
+    # The Clarifier, SWOTAnalyst and FeedbackAgent roles need no external I/O,
+    # so they are fused into a single structured-output call over the research.
+    ANALYSIS_TASK = (
+        "Clarify the business idea, perform a SWOT analysis and provide "
+        "strategic feedback."
+    )
+
+    # Used when the idea is already structured, so the clarifier role is skipped
+    STRUCTURED_ANALYSIS_TASK = (
+        "The business idea is already clarified; perform a SWOT analysis and "
+        "provide strategic feedback."
+    )
+
+    ANALYSIS_SYSTEM_MESSAGE = """You are a business validation team made up of three specialists.
+
+As the business idea clarifier:
+1. Take a raw business idea and clarify it into a well-defined concept
+2. Identify the core value proposition
+3. Define the target market and customer segments
+4. Specify the key features and benefits
+5. Describe how the business makes money
+
+As the SWOT analysis specialist:
+1. Analyze the business idea's Strengths, Weaknesses, Opportunities, and Threats
+2. Prioritize the most important factors
+3. Suggest strategies to leverage strengths and opportunities
+4. Recommend ways to address weaknesses and threats
+
+As the business strategy consultant:
+1. Review the market research, competitor analysis and SWOT analysis
+2. Suggest improvements and pivots for the business idea
+3. Identify potential business model innovations
+4. Recommend next steps for validation
+5. Provide actionable advice for moving forward
+
+Base your analysis on the market research and competitor analysis provided, and respond in the requested JSON format."""
+
+    ANALYSIS_SCHEMA = {
+        "name": "business_analysis",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "clarified_idea": {
+                    "type": "object",
+                    "properties": {
+                        "clarified_idea": {"type": "string"},
+                        "value_proposition": {"type": "string"},
+                        "target_market": {"type": "string"},
+                        "key_features": {"type": "array", "items": {"type": "string"}},
+                        "business_model": {"type": "string"},
+                    },
+                    "required": [
+                        "clarified_idea",
+                        "value_proposition",
+                        "target_market",
+                        "key_features",
+                        "business_model",
+                    ],
+                    "additionalProperties": False,
+                },
+                "swot": {
+                    "type": "object",
+                    "properties": {
+                        "strengths": {"type": "array", "items": {"type": "string"}},
+                        "weaknesses": {"type": "array", "items": {"type": "string"}},
+                        "opportunities": {"type": "array", "items": {"type": "string"}},
+                        "threats": {"type": "array", "items": {"type": "string"}},
+                        "strategic_recommendations": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                        },
+                    },
+                    "required": [
+                        "strengths",
+                        "weaknesses",
+                        "opportunities",
+                        "threats",
+                        "strategic_recommendations",
+                    ],
+                    "additionalProperties": False,
+                },
+                "feedback": {
+                    "type": "object",
+                    "properties": {
+                        "strategic_feedback": {"type": "string"},
+                        "improvement_suggestions": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                        },
+                        "potential_pivots": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                        },
+                        "validation_steps": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                        },
+                        "success_factors": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                        },
+                    },
+                    "required": [
+                        "strategic_feedback",
+                        "improvement_suggestions",
+                        "potential_pivots",
+                        "validation_steps",
+                        "success_factors",
+                    ],
+                    "additionalProperties": False,
+                },
+            },
+            "required": ["clarified_idea", "swot", "feedback"],
+            "additionalProperties": False,
+        },
+    }
+
+    # Each agent step is bounded by AGENT_TIMEOUT seconds. After
+    # CIRCUIT_BREAKER_THRESHOLD consecutive timeouts the step is skipped
+    # (circuit open) for CIRCUIT_BREAKER_RESET seconds. The next run is a
+    # probe: if it times out too, the circuit re-opens straight away.
+    AGENT_TIMEOUT = 60.0
+    CIRCUIT_BREAKER_THRESHOLD = 2
+    CIRCUIT_BREAKER_RESET = 300.0
+    AGENT_TIMEOUT_MESSAGE = "(agent timed out)"
+
     def __init__(self):
         """Initialize the Business Validator Agent system."""
         self.config_list = self._get_config_list()
         self.business_idea = None
-        self.agents = None
-        self.user_proxy = None
+        self._client = None
+        self._client_loop = None
+        self._agent_timeouts: Dict[str, int] = {}
+        self._circuit_open_until: Dict[str, float] = {}
+        # Agents are built once and hold no per-run state
+        self.agents = self._create_agents()
 
     def _get_config_list(self) -> List[Dict[str, Any]]:
-        """Get the configuration for the LLM."""
+        """Get the configuration for the LLM.
+
+        Raises ValueError if OPENAI_API_KEY is not set.
+        """
         # Try to get OpenAI API key from environment
         api_key = os.getenv("OPENAI_API_KEY")
 
-        if api_key:
-            return [
-                {
-                    "model": "gpt-4",
-                    "api_key": api_key,
-                }
-            ]
-        else:
-            # Fallback to local model or provide instructions
-            print(
-                "Warning: No OpenAI API key found. Please set OPENAI_API_KEY environment variable."
+        if not api_key:
+            # Every call goes through the OpenAI client, so there is no fallback
+            raise ValueError(
+                "No OpenAI API key found. Please set OPENAI_API_KEY environment variable."
             )
-            print("You can also use local models by modifying the config_list.")
-            return []
+
+        return [
+            {
+                "model": "gpt-4o",
+                "api_key": api_key,
+            }
+        ]
 
     def _create_agents(self) -> Dict[str, autogen.AssistantAgent]:
         """Create all the specialized agents for business validation."""
         agents = {}
 
-        # Clarifier Agent - Clarifies and refines the business idea
-        agents["clarifier"] = autogen.AssistantAgent(
-            name="Clarifier",
-            system_message="""You are a business idea clarifier. Your role is to:
-1. Take a raw business idea and clarify it into a well-defined concept
-2. Identify the core value proposition
-3. Define the target market and customer segments
-4. Specify the key features and benefits
-5. Provide a clear, concise description of the business idea
-
-Always respond with a structured format:
-- CLARIFIED IDEA: [Clear description]
-- VALUE PROPOSITION: [What problem it solves]
-- TARGET MARKET: [Who will buy it]
-- KEY FEATURES: [Main features]
-- BUSINESS MODEL: [How it makes money]""",
-            llm_config={"config_list": self.config_list},
-        )
-
         # Market Research Agent - Researches market trends and opportunities
         agents["market_researcher"] = WebSearchAgent(
             name="MarketResearcher",
@@ -181,26 +505,7 @@ Always respond with:
 - MARKET RISKS: [Potential market challenges]
 - WEB SEARCH SOURCES: [List or summarize the web search results you used]""",
             config_list=self.config_list,
-            business_idea=self.business_idea,
-        )
-
-        # SWOT Analyst - Performs SWOT analysis
-        agents["swot_analyst"] = autogen.AssistantAgent(
-            name="SWOTAnalyst",
-            system_message="""You are a SWOT analysis specialist. Your role is to:
-1. Analyze the business idea's Strengths, Weaknesses, Opportunities, and Threats
-2. Provide detailed insights for each SWOT category
-3. Prioritize the most important factors
-4. Suggest strategies to leverage strengths and opportunities
-5. Recommend ways to address weaknesses and threats
-
-Always respond with a structured SWOT analysis:
-- STRENGTHS: [List key strengths]
-- WEAKNESSES: [List key weaknesses]
-- OPPORTUNITIES: [List key opportunities]
-- THREATS: [List key threats]
-- STRATEGIC RECOMMENDATIONS: [Action items]""",
-            llm_config={"config_list": self.config_list},
+            business_idea="",
         )
 
         # Competitor Scout - Identifies and analyzes competitors
@@ -223,122 +528,560 @@ Always respond with:
 - COMPETITIVE THREATS: [What to watch out for]
 - WEB SEARCH SOURCES: [List or summarize the web search results you used]""",
             config_list=self.config_list,
-            business_idea=self.business_idea,
+            business_idea="",
         )
 
-        # Feedback Agent - Provides improvement suggestions
-        agents["feedback_agent"] = autogen.AssistantAgent(
-            name="FeedbackAgent",
-            system_message="""You are a business strategy consultant. Your role is to:
-1. Review all previous analyses and provide strategic feedback
-2. Suggest improvements and pivots for the business idea
-3. Identify potential business model innovations
-4. Recommend next steps for validation
-5. Provide actionable advice for moving forward
+        return agents
 
-Always respond with:
-- STRATEGIC FEEDBACK: [Overall assessment]
-- IMPROVEMENT SUGGESTIONS: [Specific recommendations]
-- POTENTIAL PIVOTS: [Alternative directions]
-- VALIDATION STEPS: [Next steps to test the idea]
-- SUCCESS FACTORS: [Key things to focus on]
-
-IMPORTANT: After providing your analysis, end your response with "TERMINATE" on a new line to signal that the business validation process is complete.""",
-            llm_config={"config_list": self.config_list},
-        )
+    def validate_business_idea(self, business_idea: str) -> str:
+        """Main method to validate a business idea using the multi-agent system."""
 
-        return agents
+        async def validate() -> str:
+            try:
+                return await self.a_validate_business_idea(business_idea)
+            finally:
+                # The event loop ends with this call, so its client can't be reused
+                await self.aclose()
 
-    def _create_user_proxy(self) -> autogen.UserProxyAgent:
-        """Create the user proxy agent."""
-        return autogen.UserProxyAgent(
-            name="UserProxy",
-            human_input_mode="NEVER",
-            max_consecutive_auto_reply=10,
-            is_termination_msg=lambda x: x.get("content", "")
-            .rstrip()
-            .endswith("TERMINATE"),
-            code_execution_config={"work_dir": "workspace", "use_docker": False},
-            llm_config={"config_list": self.config_list},
-        )
+        return asyncio.run(validate())
 
-    def _web_search(self, query: str) -> List[str]:
-        """Perform web search using DuckDuckGo."""
-        try:
-            with DDGS() as ddgs:
-                results = list(ddgs.text(query, max_results=5))
-                return [result["body"] for result in results]
-        except Exception as e:
-            print(f"Web search error: {e}")
-            return []
+    async def a_validate_business_idea(self, business_idea: str) -> str:
+        """(async) Validate a business idea.
 
-    def validate_business_idea(self, business_idea: str) -> str:
-        """Main method to validate a business idea using the multi-agent system."""
+        MarketResearcher and CompetitorScout share a single parallel
+        tool-calling exchange, then one structured-output call covers the
+        Clarifier, SWOTAnalyst and FeedbackAgent roles. Repeated calls on the
+        same event loop reuse one AsyncOpenAI client; call aclose() when done.
+
+        Each call keeps its search queries and seen snippets to itself, so
+        several validations can run concurrently on one event loop (e.g. with
+        asyncio.gather). self.business_idea holds the most recently started one.
+        """
         print(f"🚀 Starting business validation for: {business_idea}")
         print("=" * 60)
         self.business_idea = business_idea
-        self.agents = self._create_agents()
-        self.user_proxy = self._create_user_proxy()
+        self._ensure_client()
+        messages, analysis = await self._a_run_pipeline(business_idea)
 
-        # Initialize the workflow
-        groupchat = autogen.GroupChat(
-            agents=[self.user_proxy] + list(self.agents.values()),
-            messages=[],
-            max_round=50,
+        print("\n📋 Generating final report...")
+        # Extract the final report
+        final_report = self._generate_final_report(business_idea, messages, analysis)
+        return final_report
+
+    def _ensure_client(self) -> None:
+        """Create the AsyncOpenAI client for the running event loop if needed.
+
+        An httpx connection pool is bound to the loop that first used it, so a
+        client is only reused while the event loop stays the same.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = create_async_client(self.config_list[0]["api_key"])
+            self._client_loop = loop
+
+    async def aclose(self) -> None:
+        """Close the AsyncOpenAI client and its connection pool."""
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+            self._client_loop = None
+
+    async def _a_run_pipeline(
+        self, business_idea: str
+    ) -> Tuple[List[Dict], Optional[Dict[str, Any]]]:
+        """Run the research and analysis stages.
+
+        Returns the research agents' messages and the structured analysis.
+        """
+        messages = []
+        context = {}
+
+        print("🤖 Starting multi-agent analysis...")
+        market_research, competitor_analysis = await self._a_call_agent(
+            "Research",
+            lambda: self._a_research(business_idea, context),
+            (self.AGENT_TIMEOUT_MESSAGE, self.AGENT_TIMEOUT_MESSAGE),
         )
+        for agent_key, content in (
+            ("market_researcher", market_research),
+            ("competitor_scout", competitor_analysis),
+        ):
+            agent_name = self.agents[agent_key].name
+            self._print_agent_response(agent_name, content)
+            messages.append(
+                {"role": "assistant", "name": agent_name, "content": content}
+            )
+            context[agent_name] = content
 
-        manager = autogen.GroupChatManager(
-            groupchat=groupchat, llm_config={"config_list": self.config_list}
+        analysis = await self._a_call_agent(
+            "Analyst", lambda: self._a_analyze(business_idea, context), None
         )
+        return messages, analysis
 
-        # Custom message handler to show agent responses clearly
-        def message_handler(sender, message):
-            print(f"\n📝 {sender.name}:")
-            print("-" * 40)
-            # Show first 200 characters of response
-            content = message.get("content", "")
-            preview = content[:200] + "..." if len(content) > 200 else content
-            print(preview)
-            if len(content) > 200:
-                print("... (response continues)")
-            print("-" * 40)
-
-        # Add message handler to track responses
-        original_send = manager.send
-
-        def send_with_logging(message, recipient, request_reply, silent):
-            result = original_send(message, recipient, request_reply, silent)
-            if not silent:
-                message_handler(recipient, message)
-            return result
-
-        manager.send = send_with_logging
-
-        # Start the validation process
-        initial_message = f"""
-Please validate this business idea: "{business_idea}"
-
-Here's the workflow:
-1. Clarifier: First, clarify and refine the business idea
-2. MarketResearcher: Research market trends and opportunities (will use web search for current data)
-3. CompetitorScout: Identify and analyze competitors (will use web search for current competitors)
-4. SWOTAnalyst: Perform a comprehensive SWOT analysis
-5. FeedbackAgent: Provide strategic feedback and improvement suggestions
-
-Each agent should build upon the previous agent's work. The MarketResearcher and CompetitorScout agents will perform real web searches to get current information.
-"""
+    async def _a_call_agent(
+        self, agent_name: str, call: Callable[[], Awaitable[Any]], fallback: Any
+    ) -> Any:
+        """Run an agent step with a timeout and a per-agent circuit breaker.
 
-        print("🤖 Starting multi-agent conversation...")
-        # Start the conversation
-        self.user_proxy.initiate_chat(manager, message=initial_message)
+        Returns ``fallback`` if the step times out or its circuit is open.
+        """
+        if time.monotonic() < self._circuit_open_until.get(agent_name, 0.0):
+            print(f"⏭️  Skipping {agent_name}: too many consecutive timeouts")
+            return fallback
 
-        print("\n📋 Generating final report...")
-        # Extract the final report
-        final_report = self._generate_final_report(business_idea, groupchat.messages)
-        return final_report
+        try:
+            result = await asyncio.wait_for(call(), self.AGENT_TIMEOUT)
+        except asyncio.TimeoutError:
+            print(f"⏱️  {agent_name} timed out after {self.AGENT_TIMEOUT:g}s")
+            failures = self._agent_timeouts.get(agent_name, 0) + 1
+            if failures >= self.CIRCUIT_BREAKER_THRESHOLD:
+                # The count stays at the threshold, so once the circuit
+                # closes again a single failed probe re-opens it
+                self._circuit_open_until[agent_name] = (
+                    time.monotonic() + self.CIRCUIT_BREAKER_RESET
+                )
+            self._agent_timeouts[agent_name] = failures
+            return fallback
+
+        self._agent_timeouts[agent_name] = 0
+        return result
+
+    @staticmethod
+    def _build_prompt(business_idea: str, task: str, context: Dict[str, str]) -> str:
+        """Build an agent prompt from the business idea and earlier agent outputs."""
+        parts = [f'Please validate this business idea: "{business_idea}"']
+        for agent_name, content in context.items():
+            parts.append(f"Analysis from {agent_name}:\n{content}")
+        if context:
+            parts.append(f"Your task: {task} Build upon the previous analyses above.")
+        else:
+            parts.append(f"Your task: {task}")
+        return "\n\n".join(parts)
+
+    async def _a_research(
+        self, business_idea: str, context: Dict[str, str]
+    ) -> Tuple[str, str]:
+        """Run market and competitor research as one parallel tool-calling exchange.
+
+        The model requests both web searches in a single response; they are
+        dispatched concurrently and their results fed back in one follow-up
+        call that writes both analyses. The first call must request a tool,
+        and each agent's standard search starts before it, so the search
+        overlaps with the model's response.
+        Returns (market_research, competitor_analysis).
+        """
+        market_agent = self.agents["market_researcher"]
+        competitor_agent = self.agents["competitor_scout"]
+        system_message = f"""You lead the market and competitor research for a business idea.
+First call the market_research and competitor_scout tools (in parallel) to search the web, then write both analyses from their results.
+
+{market_agent.system_message}
+
+{competitor_agent.system_message}
+
+Write the market research section first, starting with a line that reads exactly "{self.MARKET_SECTION}", followed by the competitor section, starting with a line that reads exactly "{self.COMPETITOR_SECTION}"."""
+        prompt = self._build_prompt(
+            business_idea,
+            f"{self.AGENT_TASKS['market_researcher']} {self.AGENT_TASKS['competitor_scout']}",
+            context,
+        )
+        model = self.config_list[0]["model"]
+        messages = [
+            {"role": "system", "content": system_message},
+            {"role": "user", "content": prompt},
+        ]
+
+        subject = self._search_subject(business_idea)
+        queries = {
+            agent_key: self.agents[agent_key]._search_query(subject)
+            for agent_key in self.RESEARCH_TOOL_AGENTS.values()
+        }
+        prefetched = {
+            agent_key: asyncio.create_task(
+                self.agents[agent_key].web_search_async(query)
+            )
+            for agent_key, query in queries.items()
+        }
+        try:
+            return await self._a_research_exchange(model, messages, queries, prefetched)
+        finally:
+            # Searches the model never asked for are discarded
+            for task in prefetched.values():
+                task.cancel()
+
+    async def _a_research_exchange(
+        self,
+        model: str,
+        messages: List[Dict],
+        queries: Dict[str, str],
+        prefetched: Dict[str, "asyncio.Task[List[str]]"],
+    ) -> Tuple[str, str]:
+        """Run the tool-calling exchange using the prefetched standard searches.
+
+        ``queries`` maps each research agent to its standard search query.
+        """
+        response = await logging_create(
+            self._client,
+            model=model,
+            messages=messages,
+            tools=self.RESEARCH_TOOLS,
+            # Without a tool call the analyses would be written with no web results
+            tool_choice="required",
+        )
+        message = response.choices[0].message
+        if message.tool_calls:
+            searches = await asyncio.gather(
+                *(
+                    self._a_run_research_tool(tool_call, queries, prefetched)
+                    for tool_call in message.tool_calls
+                )
+            )
+            # Filter in agent order once every search is done, so a snippet
+            # both searches return always goes to the market researcher
+            agent_order = {agent_key: i for i, agent_key in enumerate(self.AGENT_TASKS)}
+            seen: set = set()
+            tool_messages = {}
+            for tool_call, (agent_key, results) in sorted(
+                zip(message.tool_calls, searches),
+                key=lambda item: agent_order.get(item[1][0], len(agent_order)),
+            ):
+                tool_messages[tool_call.id] = self._research_tool_message(
+                    tool_call, agent_key, results, seen
+                )
+            messages.append(
+                {
+                    "role": "assistant",
+                    "content": message.content,
+                    "tool_calls": [
+                        {
+                            "id": tool_call.id,
+                            "type": "function",
+                            "function": {
+                                "name": tool_call.function.name,
+                                "arguments": tool_call.function.arguments,
+                            },
+                        }
+                        for tool_call in message.tool_calls
+                    ],
+                }
+            )
+            messages.extend(
+                tool_messages[tool_call.id] for tool_call in message.tool_calls
+            )
+            response = await logging_create(
+                self._client,
+                model=model,
+                messages=messages,
+                tools=self.RESEARCH_TOOLS,
+                tool_choice="none",
+            )
+            message = response.choices[0].message
+
+        return self._split_research(message.content or "")
+
+    async def _a_run_research_tool(
+        self,
+        tool_call,
+        queries: Dict[str, str],
+        prefetched: Dict[str, "asyncio.Task[List[str]]"],
+    ) -> Tuple[Optional[str], List[List[str]]]:
+        """Run the web searches requested by a research tool call.
+
+        Uses the agent's prefetched standard search (once) and, if the model
+        asked for a different query, searches that as well. Returns the
+        agent key (None for an unknown tool) and the results of each search.
+        """
+        agent_key = self.RESEARCH_TOOL_AGENTS.get(tool_call.function.name)
+        if agent_key is None:
+            return None, []
+
+        agent = self.agents[agent_key]
+        standard_query = queries[agent_key]
+        try:
+            query = json.loads(tool_call.function.arguments or "{}").get("query")
+        except json.JSONDecodeError:
+            query = None
+
+        searches = [
+            prefetched.pop(agent_key, None) or agent.web_search_async(standard_query)
+        ]
+        if query and query != standard_query:
+            searches.append(agent.web_search_async(query))
+        return agent_key, list(await asyncio.gather(*searches))
+
+    def _research_tool_message(
+        self,
+        tool_call,
+        agent_key: Optional[str],
+        results: List[List[str]],
+        seen: set,
+    ) -> Dict[str, str]:
+        """Build the tool reply, forwarding only snippets not already in ``seen``."""
+        if agent_key is None:
+            content = f"Unknown tool: {tool_call.function.name}"
+        else:
+            agent = self.agents[agent_key]
+            # Standard results first, then up to two extra ones from the model's query
+            search_results = _take_novel_snippets(results[0], seen, 3)
+            if len(results) > 1:
+                search_results += _take_novel_snippets(results[1], seen, 2)
+            if search_results:
+                print(f"📊 Found {len(search_results)} search results")
+                content = "WEB SEARCH RESULTS:\n" + "\n".join(search_results)
+            else:
+                print(f"⚠️  No web search results found for {agent.name}")
+                content = "No relevant web search results found."
+        return {"role": "tool", "tool_call_id": tool_call.id, "content": content}
+
+    @classmethod
+    def _split_research(cls, content: str) -> Tuple[str, str]:
+        """Split the combined research reply into its market and competitor sections.
+
+        Each section runs from its heading to the next heading. A section
+        whose heading is missing comes back empty; a reply with neither
+        heading is kept whole as the market section.
+        """
+        headings = _compile_patterns((cls.MARKET_SECTION, cls.COMPETITOR_SECTION))
+        matches = list(headings.finditer(content))
+        if not matches:
+            return content.strip(), ""
+
+        sections = {}
+        for match, next_match in zip(matches, matches[1:] + [None]):
+            end = next_match.start() if next_match else len(content)
+            sections.setdefault(match.group(), content[match.start() : end].strip())
+        return (
+            sections.get(cls.MARKET_SECTION, ""),
+            sections.get(cls.COMPETITOR_SECTION, ""),
+        )
+
+    async def _a_analyze(
+        self, business_idea: str, context: Dict[str, str]
+    ) -> Optional[Dict[str, Any]]:
+        """Clarify, SWOT-analyze and give feedback on the idea in one call.
+
+        Returns the parsed analysis, or None if the model did not return
+        valid JSON.
+        """
+        model = self.config_list[0]["model"]
+        response = await logging_create(
+            self._client,
+            model=model,
+            **self._analysis_request(business_idea, context),
+        )
+        content = response.choices[0].message.content or ""
+        self._print_agent_response("Analyst", content)
+        return self._parse_analysis(business_idea, content)
+
+    def _analysis_request(
+        self, business_idea: str, context: Dict[str, str]
+    ) -> Dict[str, Any]:
+        """Build the request body (minus the model) for the fused analysis call.
+
+        If the idea is already structured, the clarified idea is left out of
+        the response schema since the idea itself is used instead.
+        """
+        schema = self.ANALYSIS_SCHEMA
+        task = self.ANALYSIS_TASK
+        if self._parse_structured_idea(business_idea):
+            print("⏭️  Business idea is already structured, skipping clarification")
+            schema = copy.deepcopy(schema)
+            del schema["schema"]["properties"]["clarified_idea"]
+            schema["schema"]["required"].remove("clarified_idea")
+            task = self.STRUCTURED_ANALYSIS_TASK
+
+        return {
+            "messages": [
+                {"role": "system", "content": self.ANALYSIS_SYSTEM_MESSAGE},
+                {
+                    "role": "user",
+                    "content": self._build_prompt(business_idea, task, context),
+                },
+            ],
+            "response_format": {"type": "json_schema", "json_schema": schema},
+        }
+
+    def _parse_analysis(
+        self, business_idea: str, content: str
+    ) -> Optional[Dict[str, Any]]:
+        """Parse the fused analysis JSON, or return None if it is invalid."""
+        try:
+            analysis = json.loads(content)
+        except json.JSONDecodeError:
+            print("⚠️  Analysis response was not valid JSON")
+            return None
+
+        structured = self._parse_structured_idea(business_idea)
+        if structured:
+            analysis["clarified_idea"] = structured
+        return analysis
+
+    @staticmethod
+    def _parse_structured_idea(business_idea: str) -> Optional[Dict[str, Any]]:
+        """Return the idea as a dict if it is already a structured JSON description.
+
+        An idea counts as structured when it is a JSON object with at least a
+        value_proposition and a target_market.
+        """
+        if not business_idea.lstrip().startswith("{"):
+            return None
+        try:
+            idea = json.loads(business_idea)
+        except json.JSONDecodeError:
+            return None
+        if isinstance(idea, dict) and {"value_proposition", "target_market"} <= set(
+            idea
+        ):
+            return idea
+        return None
+
+    def _search_subject(self, business_idea: str) -> str:
+        """Describe the idea for web search queries."""
+        structured = self._parse_structured_idea(business_idea)
+        if structured:
+            return str(
+                structured.get("clarified_idea") or structured["value_proposition"]
+            )
+        return business_idea
+
+    @staticmethod
+    def _print_agent_response(agent_name: str, content: str) -> None:
+        """Print a short preview of an agent's response."""
+        print(f"\n📝 {agent_name}:")
+        print("-" * 40)
+        # Show first 200 characters of response
+        preview = content[:200] + "..." if len(content) > 200 else content
+        print(preview)
+        if len(content) > 200:
+            print("... (response continues)")
+        print("-" * 40)
+
+    def validate_business_ideas_batch(
+        self, ideas: List[str], poll_interval: float = 60.0
+    ) -> Dict[str, str]:
+        """Validate many business ideas offline through the OpenAI Batch API.
+
+        The research stage and the analysis stage are each submitted as one
+        batch covering every idea, so all calls are billed at batch rates. A
+        batch can take up to 24 hours to complete; use this for evaluation
+        sweeps, not interactive runs.
+        Returns a mapping of business idea to its report.
+        """
+        config = self.config_list[0]
+        client = openai.OpenAI(api_key=config["api_key"])
+        model = config["model"]
+
+        ideas_by_id = {
+            hashlib.sha1(idea.encode("utf-8")).hexdigest()[:16]: idea for idea in ideas
+        }
+        contexts = {idea_id: {} for idea_id in ideas_by_id}
+        messages = {idea_id: [] for idea_id in ideas_by_id}
+
+        print(f"📦 Starting batch validation for {len(ideas_by_id)} ideas")
+        requests = {}
+        for idea_id, idea in ideas_by_id.items():
+            subject = self._search_subject(idea)
+            seen: set = set()
+            for agent_key, task in self.AGENT_TASKS.items():
+                agent = self.agents[agent_key]
+                prompt = self._build_prompt(idea, task, {})
+                agent_messages = agent._with_search_results(
+                    [{"role": "user", "content": prompt}],
+                    _take_novel_snippets(
+                        agent.web_search(agent._search_query(subject)), seen, 3
+                    ),
+                )
+                requests[f"{idea_id}:{agent_key}"] = {
+                    "messages": [{"role": "system", "content": agent.system_message}]
+                    + agent_messages
+                }
+
+        replies = self._run_batch(client, model, requests, poll_interval)
+        for custom_id in requests:
+            idea_id, agent_key = custom_id.split(":")
+            agent_name = self.agents[agent_key].name
+            content = replies.get(custom_id, "")
+            contexts[idea_id][agent_name] = content
+            messages[idea_id].append(
+                {"role": "assistant", "name": agent_name, "content": content}
+            )
+
+        requests = {
+            idea_id: self._analysis_request(idea, contexts[idea_id])
+            for idea_id, idea in ideas_by_id.items()
+        }
+        replies = self._run_batch(client, model, requests, poll_interval)
+
+        return {
+            idea: self._generate_final_report(
+                idea,
+                messages[idea_id],
+                self._parse_analysis(idea, replies.get(idea_id, "")),
+            )
+            for idea_id, idea in ideas_by_id.items()
+        }
+
+    def _run_batch(
+        self,
+        client: openai.OpenAI,
+        model: str,
+        requests: Dict[str, Dict[str, Any]],
+        poll_interval: float,
+    ) -> Dict[str, str]:
+        """Run chat completions as one batch job and return replies by custom_id.
+
+        ``requests`` maps each custom_id to its request body minus the model.
+        """
+        lines = [
+            json.dumps(
+                {
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {"model": model, **body},
+                }
+            )
+            for custom_id, body in requests.items()
+        ]
+        batch_file = client.files.create(
+            file=("batch.jsonl", "\n".join(lines).encode("utf-8")), purpose="batch"
+        )
+        batch = client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        print(f"📦 Submitted batch {batch.id} with {len(lines)} requests")
+
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(poll_interval)
+            batch = client.batches.retrieve(batch.id)
+        if batch.status != "completed":
+            raise RuntimeError(f"Batch {batch.id} ended with status {batch.status}")
+
+        replies = {}
+        if batch.output_file_id:
+            output = client.files.content(batch.output_file_id).text
+            for line in output.splitlines():
+                if not line.strip():
+                    continue
+                result = json.loads(line)
+                response = result.get("response") or {}
+                if response.get("status_code") == 200:
+                    message = response["body"]["choices"][0]["message"]
+                    replies[result["custom_id"]] = message.get("content") or ""
+
+        failed = len(requests) - len(replies)
+        if failed:
+            print(f"⚠️  {failed} batch requests in {batch.id} failed")
+        return replies
 
     def _generate_final_report(
-        self, business_idea: str, messages: List[Dict], debug: bool = False
+        self,
+        business_idea: str,
+        messages: List[Dict],
+        analysis: Optional[Dict[str, Any]] = None,
+        debug: bool = False,
     ) -> str:
         """Generate a structured final report from the conversation. Optionally print the full conversation for debugging."""
         if debug:
@@ -347,7 +1090,7 @@ Each agent should build upon the previous agent's work. The MarketResearcher and
                 print(f"[{m.get('role')}] {m.get('content','')[:500]}\n---")
             print("\n--- END OF CONVERSATION LOG ---\n")
 
-        report = f"""
+        parts = [f"""
 # Business Validation Report
 **Business Idea:** {business_idea}
 **Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
@@ -356,58 +1099,51 @@ Each agent should build upon the previous agent's work. The MarketResearcher and
 This report provides a comprehensive validation analysis of the business idea using a multi-agent AI system with real-time web research.
 
 ## Analysis Results
-"""
+"""]
 
         # Extract agent responses by looking for content patterns since the name field may not be set correctly
-        def find_agent_response(pattern_start, pattern_end=None):
-            for m in reversed(messages):
-                if m.get("role") == "assistant":
-                    content = m.get("content", "")
-                    if pattern_start in content:
-                        if pattern_end:
-                            start_idx = content.find(pattern_start)
-                            end_idx = content.find(pattern_end, start_idx)
-                            if end_idx != -1:
-                                return content[start_idx : end_idx + len(pattern_end)]
-                        return content
-            return None
+        responses = self._find_agent_responses(
+            messages,
+            [
+                self.MARKET_SECTION,
+                "MARKET SIZE:",
+                self.COMPETITOR_SECTION,
+                "DIRECT COMPETITORS:",
+            ],
+        )
 
         # Market Research - look for "MARKET RESEARCHER" or "MARKET SIZE:"
-        market_research = find_agent_response(
-            "### MARKET RESEARCHER"
-        ) or find_agent_response("MARKET SIZE:")
+        market_research = responses.get(self.MARKET_SECTION) or responses.get(
+            "MARKET SIZE:"
+        )
         if market_research:
-            report += f"\n### Market Research\n{market_research}\n"
+            parts.append(f"\n### Market Research\n{market_research}\n")
         else:
-            report += "\n### Market Research\n(No MarketResearcher output found.)\n"
+            parts.append("\n### Market Research\n(No MarketResearcher output found.)\n")
 
         # Competitor Analysis - look for "COMPETITOR SCOUT" or "DIRECT COMPETITORS:"
-        competitor_analysis = find_agent_response(
-            "### COMPETITOR SCOUT"
-        ) or find_agent_response("DIRECT COMPETITORS:")
+        competitor_analysis = responses.get(self.COMPETITOR_SECTION) or responses.get(
+            "DIRECT COMPETITORS:"
+        )
         if competitor_analysis:
-            report += f"\n### Competitive Analysis\n{competitor_analysis}\n"
+            parts.append(f"\n### Competitive Analysis\n{competitor_analysis}\n")
         else:
-            report += "\n### Competitive Analysis\n(No CompetitorScout output found.)\n"
-
-        # Clarified Idea - look for "CLARIFIED IDEA:"
-        clarified = find_agent_response("CLARIFIED IDEA:", "BUSINESS MODEL:")
-        if clarified:
-            report += f"\n### Clarified Business Idea\n{clarified}\n"
-
-        # SWOT Analysis - look for "SWOT ANALYSIS" or "STRENGTHS:"
-        swot = find_agent_response("### SWOT ANALYSIS") or find_agent_response(
-            "STRENGTHS:"
-        )
-        if swot:
-            report += f"\n### SWOT Analysis\n{swot}\n"
-
-        # Feedback - look for "STRATEGIC FEEDBACK:"
-        feedback = find_agent_response("STRATEGIC FEEDBACK:", "TERMINATE")
-        if feedback:
-            report += f"\n### Strategic Feedback\n{feedback}\n"
+            parts.append(
+                "\n### Competitive Analysis\n(No CompetitorScout output found.)\n"
+            )
 
-        report += """
+        # Clarified idea, SWOT and feedback come from the structured analysis
+        if analysis:
+            for title, key in (
+                ("Clarified Business Idea", "clarified_idea"),
+                ("SWOT Analysis", "swot"),
+                ("Strategic Feedback", "feedback"),
+            ):
+                if analysis.get(key):
+                    section = self._format_analysis_section(analysis[key])
+                    parts.append(f"\n### {title}\n{section}\n")
+
+        parts.append("""
 ## Recommendations
 Based on the analysis above, consider the following next steps:
 1. Validate assumptions with potential customers
@@ -418,8 +1154,42 @@ Based on the analysis above, consider the following next steps:
 
 ---
 *Report generated by Business Validator AI Agent with real-time web research*
-"""
-        return report
+""")
+        return "".join(parts)
+
+    @staticmethod
+    def _find_agent_responses(
+        messages: List[Dict], patterns: List[str]
+    ) -> Dict[str, str]:
+        """Map each pattern to the latest assistant message containing it.
+
+        The messages are scanned once, newest first, with a single matcher for
+        all patterns, stopping as soon as every pattern has been found.
+        """
+        matcher = _compile_patterns(tuple(patterns))
+        responses = {}
+        for m in reversed(messages):
+            if len(responses) == len(patterns):
+                break
+            if m.get("role") != "assistant":
+                continue
+            content = m.get("content") or ""
+            for match in matcher.finditer(content):
+                responses.setdefault(match.group(), content)
+        return responses
+
+    @staticmethod
+    def _format_analysis_section(fields: Dict[str, Any]) -> str:
+        """Render one section of the structured analysis as labelled markdown."""
+        lines = []
+        for key, value in fields.items():
+            label = key.replace("_", " ").upper()
+            if isinstance(value, list):
+                lines.append(f"- {label}:")
+                lines.extend(f"  - {item}" for item in value)
+            else:
+                lines.append(f"- {label}: {value}")
+        return "\n".join(lines)
 
     def save_report(self, report: str, filename: str = None) -> str:
         """Save the report to a markdown file."""
@@ -450,10 +1220,9 @@ def main():
     print("🔄 Starting validation process...")
     print("=" * 60)
 
-    # Create validator and run analysis
-    validator = BusinessValidatorAgent()
-
     try:
+        # Create validator and run analysis
+        validator = BusinessValidatorAgent()
         report = validator.validate_business_idea(business_idea)
 
         # Save the report
@@ -0,0 +1,176 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+from duckduckgo_search.exceptions import RatelimitException
+
+import business_validator
+
+
+class StubDDGS:
+    """Stands in for DDGS; text() rate-limits the queries in ``rate_limited`` once.
+
+    If ``in_flight`` is set, the first search of each query waits on it, so
+    those searches are all running at the same time.
+    """
+
+    rate_limited: set = set()
+    in_flight = None
+    searches: list = []
+    closed: list = []
+    lock = threading.Lock()
+
+    def text(self, query, max_results=None):
+        if self.in_flight and all(query != q for _, q in self.searches):
+            self.in_flight.wait(timeout=5)
+        with self.lock:
+            self.searches.append((self, query))
+            if query in self.rate_limited:
+                self.rate_limited.discard(query)
+                raise RatelimitException(f"{query} 202 Ratelimit")
+        return [{"title": query, "href": "https://example.com", "body": query}]
+
+    def __exit__(self, *exc_info):
+        self.closed.append(self)
+
+
+def _agent(monkeypatch, rate_limited):
+    monkeypatch.setattr(StubDDGS, "rate_limited", set(rate_limited))
+    monkeypatch.setattr(StubDDGS, "searches", [])
+    monkeypatch.setattr(StubDDGS, "closed", [])
+    monkeypatch.setattr(business_validator, "DDGS", StubDDGS)
+    monkeypatch.setattr(business_validator.time, "sleep", lambda delay: None)
+    return business_validator.WebSearchAgent(
+        name="MarketResearcher",
+        system_message="",
+        config_list=[{"model": "gpt-4o", "api_key": "sk-test"}],
+        business_idea="coffee",
+    )
+
+
+def test_rate_limited_search_is_retried_on_a_fresh_client(monkeypatch):
+    agent = _agent(monkeypatch, rate_limited={"coffee market"})
+
+    results = agent._ddg_text("coffee market")
+
+    assert [result["body"] for result in results] == ["coffee market"]
+    (failed, _), (retried, _) = StubDDGS.searches
+    assert retried is not failed
+    assert StubDDGS.closed == [failed]
+    assert agent._idle_ddgs == [retried]
+
+
+def test_rate_limit_does_not_reach_searches_on_other_threads(monkeypatch):
+    agent = _agent(monkeypatch, rate_limited={"coffee competitors"})
+    monkeypatch.setattr(StubDDGS, "in_flight", threading.Barrier(2))
+    results = {}
+
+    def search(query):
+        results[query] = agent._ddg_text(query)
+
+    threads = [
+        threading.Thread(target=search, args=(query,))
+        for query in ("coffee market", "coffee competitors")
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert {query: len(rows) for query, rows in results.items()} == {
+        "coffee market": 1,
+        "coffee competitors": 1,
+    }
+    # The concurrent searches ran on separate clients
+    first_attempts = {query: ddgs for ddgs, query in reversed(StubDDGS.searches)}
+    assert first_attempts["coffee market"] is not first_attempts["coffee competitors"]
+    (failed,) = StubDDGS.closed
+    assert failed is first_attempts["coffee competitors"]
+    assert failed not in agent._idle_ddgs
+
+    # A later search on another thread runs on a pooled client, not the failed one
+    monkeypatch.setattr(StubDDGS, "in_flight", None)
+    idle = list(agent._idle_ddgs)
+    thread = threading.Thread(target=search, args=("coffee pricing",))
+    thread.start()
+    thread.join()
+    assert StubDDGS.searches[-1][0] in idle
+    assert StubDDGS.searches[-1][0] is not failed
+
+
+def test_split_research_cuts_at_the_section_headings():
+    split = business_validator.BusinessValidatorAgent._split_research(
+        "Here is the research.\n\n"
+        "### MARKET RESEARCHER\n- MARKET SIZE: 1\n\n"
+        "### COMPETITOR SCOUT\n- DIRECT COMPETITORS: 2"
+    )
+
+    assert split == (
+        "### MARKET RESEARCHER\n- MARKET SIZE: 1",
+        "### COMPETITOR SCOUT\n- DIRECT COMPETITORS: 2",
+    )
+
+
+def test_split_research_keeps_sections_in_either_order():
+    split = business_validator.BusinessValidatorAgent._split_research(
+        "### COMPETITOR SCOUT\n- DIRECT COMPETITORS: 2\n"
+        "### MARKET RESEARCHER\n- MARKET SIZE: 1"
+    )
+
+    assert split == (
+        "### MARKET RESEARCHER\n- MARKET SIZE: 1",
+        "### COMPETITOR SCOUT\n- DIRECT COMPETITORS: 2",
+    )
+
+
+def test_split_research_does_not_duplicate_a_reply_without_headings():
+    split = business_validator.BusinessValidatorAgent._split_research(
+        "- MARKET SIZE: 1\n- DIRECT COMPETITORS: 2"
+    )
+
+    assert split == ("- MARKET SIZE: 1\n- DIRECT COMPETITORS: 2", "")
+
+
+def test_validator_without_api_key_raises_a_clear_error(monkeypatch):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+
+    with pytest.raises(ValueError, match="OPENAI_API_KEY"):
+        business_validator.BusinessValidatorAgent()
+
+
+def test_circuit_breaker_reopens_after_one_failed_probe(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    validator = business_validator.BusinessValidatorAgent()
+    monkeypatch.setattr(validator, "AGENT_TIMEOUT", 0.01)
+    now = [1000.0]
+    monkeypatch.setattr(
+        business_validator, "time", SimpleNamespace(monotonic=lambda: now[0])
+    )
+    calls = []
+
+    async def hang():
+        calls.append("hang")
+        await asyncio.sleep(1)
+
+    def call_agent():
+        return asyncio.run(validator._a_call_agent("Analyst", hang, "fallback"))
+
+    # Two timeouts open the circuit, so the third run is skipped
+    assert [call_agent() for _ in range(3)] == ["fallback"] * 3
+    assert len(calls) == 2
+
+    # After the reset period one probe runs; its timeout re-opens the circuit
+    now[0] += validator.CIRCUIT_BREAKER_RESET
+    assert call_agent() == "fallback"
+    assert len(calls) == 3
+    assert call_agent() == "fallback"
+    assert len(calls) == 3
+
+    # A successful probe closes the circuit again
+    async def succeed():
+        return "result"
+
+    now[0] += validator.CIRCUIT_BREAKER_RESET
+    assert asyncio.run(validator._a_call_agent("Analyst", succeed, None)) == "result"
+    assert validator._agent_timeouts["Analyst"] == 0